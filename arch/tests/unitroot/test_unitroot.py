@@ -21,11 +21,14 @@ from arch.unitroot import ADF, DFGLS, KPSS, PhillipsPerron, VarianceRatio, Zivot
 from arch.unitroot.critical_values.dickey_fuller import tau_2010
 from arch.unitroot.unitroot import (
     _autolag_ols,
+    _bartlett_lrv,
     _is_reduced_rank,
+    _lag_products,
     auto_bandwidth,
     mackinnoncrit,
     mackinnonp,
 )
+from arch.utility import cov_nw
 from arch.utility.exceptions import InfeasibleTestException
 
 DECIMAL_5 = 5
@@ -165,6 +168,25 @@ class TestUnitRoot(object):
             pp.test_type = "rho"
         assert_almost_equal(pp.stat, -118.7746451, DECIMAL_2)
 
+    def test_pp_test_type_reuses_regression(self):
+        pp = PhillipsPerron(self.inflation, lags=12)
+        tau = pp.stat
+        stats_key = pp._stats_key
+        with pytest.warns(FutureWarning, match="Mutating unit root"):
+            pp.test_type = "rho"
+        direct = PhillipsPerron(self.inflation, lags=12, test_type="rho")
+        assert_allclose(pp.stat, direct.stat)
+        assert_allclose(pp.pvalue, direct.pvalue)
+        assert pp._stats_key is stats_key
+        with pytest.warns(FutureWarning, match="Mutating unit root"):
+            pp.trend = "ct"
+        with pytest.warns(FutureWarning, match="Mutating unit root"):
+            pp.test_type = "tau"
+        assert pp.stat != tau
+        assert_allclose(
+            pp.stat, PhillipsPerron(self.inflation, lags=12, trend="ct").stat
+        )
+
     def test_dfgls_c(self):
         dfgls = DFGLS(self.inflation, trend="c", lags=0)
         assert_almost_equal(dfgls.stat, -6.017304, DECIMAL_4)
@@ -413,6 +435,114 @@ def test_trends_low_memory(trend):
     assert_equal(adf.max_lags, 1)
 
 
+@pytest.mark.parametrize("drift", [1e3, 1e5, 1e6])
+@pytest.mark.parametrize("low_memory", [True, False])
+def test_adf_ct_drift_invariance(drift, low_memory):
+    rnd = np.random.RandomState(0)
+    e = np.cumsum(rnd.standard_normal(500))
+    t = np.arange(500.0)
+    y = drift * t + e
+    fixed = ADF(y, trend="ct", lags=2)
+    assert_allclose(fixed.stat, ADF(e, trend="ct", lags=2).stat, rtol=1e-8)
+    auto = ADF(y, trend="ct", max_lags=2, low_memory=low_memory)
+    expected = ADF(e, trend="ct", max_lags=2, low_memory=low_memory)
+    assert auto.lags == expected.lags
+    assert_allclose(auto.stat, expected.stat, rtol=1e-8)
+
+
+@pytest.mark.parametrize("trend", ["n", "c", "ct", "ctt"])
+def test_auto_lag_regression(trend):
+    rnd = np.random.RandomState(12345)
+    y = np.cumsum(rnd.standard_normal(250))
+    adf = ADF(y, trend=trend, max_lags=16)
+    direct = ADF(y, trend=trend, lags=adf.lags)
+    assert_allclose(adf.stat, direct.stat)
+    assert_allclose(adf.stat, adf.regression.tvalues[0])
+    assert adf.nobs == direct.nobs == adf.regression.nobs
+    if trend in ("c", "ct"):
+        dfgls = DFGLS(y, trend=trend, max_lags=16)
+        direct = DFGLS(y, trend=trend, lags=dfgls.lags)
+        assert_allclose(dfgls.stat, direct.stat)
+        assert_allclose(dfgls.stat, dfgls.regression.tvalues[0])
+        assert dfgls.nobs == direct.nobs
+
+
+@pytest.mark.parametrize("nlags", [0, 4, 120, 179, 180, 499])
+def test_lag_products(nlags):
+    rnd = np.random.RandomState(12345)
+    x = rnd.standard_normal(500)
+    expected = [x[i:] @ x[: x.shape[0] - i] for i in range(nlags + 1)]
+    assert_allclose(_lag_products(x, nlags), expected, atol=1e-10)
+
+
+@pytest.mark.parametrize("lags", [0, 3, 40, 499, 500])
+def test_bartlett_lrv(lags):
+    rnd = np.random.RandomState(12345)
+    u = rnd.standard_normal(500)
+    assert_allclose(_bartlett_lrv(u, lags), cov_nw(u, lags, demean=False))
+
+
+@pytest.mark.filterwarnings("ignore:Mutating unit root:FutureWarning")
+@pytest.mark.filterwarnings("ignore:Lag selection has changed:DeprecationWarning")
+@pytest.mark.parametrize("test", [ADF, DFGLS, PhillipsPerron, KPSS])
+def test_cached_results(test):
+    rnd = np.random.RandomState(12345)
+    y = np.cumsum(rnd.standard_normal(250))
+    res = test(y, trend="c")
+    stat, pvalue, lags = res.stat, res.pvalue, res.lags
+    cv = res.critical_values.copy()
+    # Mutating returned values must not alter the cached results
+    res.critical_values["1%"] = np.nan
+    res.trend = "ct"
+    assert res.stat != stat
+    res.trend = "c"
+    assert res._stat is None
+    assert res.stat == stat
+    assert res.pvalue == pvalue
+    assert res.lags == lags
+    assert res.critical_values == cv
+    direct = test(y, trend="c", lags=lags)
+    assert_allclose(res.stat, direct.stat)
+    if test in (ADF, DFGLS):
+        assert_allclose(res.regression.params, direct.regression.params)
+
+
+@pytest.mark.filterwarnings("ignore:Mutating unit root:FutureWarning")
+def test_cached_results_bounded():
+    rnd = np.random.RandomState(12345)
+    y = np.cumsum(rnd.standard_normal(250))
+    res = KPSS(y, trend="c", lags=1)
+    stat = res.stat
+    for lags in range(2, 21):
+        res.lags = lags
+        assert np.isfinite(res.stat)
+        assert len(res._cache) <= 8
+    assert (res.trend, 1) not in res._cache
+    res.lags = 1
+    assert res.stat == stat
+
+
+@pytest.mark.parametrize("trend", ["n", "c", "ct", "ctt"])
+def test_auto_lag_tstat_low_memory_no_lags(trend):
+    rnd = np.random.RandomState(1)
+    y = np.cumsum(rnd.standard_normal(250))
+    adf = ADF(y, trend=trend, method="t-stat", max_lags=4)
+    low_mem = ADF(y, trend=trend, method="t-stat", max_lags=4, low_memory=True)
+    assert adf.lags == low_mem.lags == 0
+    assert_allclose(adf.stat, low_mem.stat)
+
+
+@pytest.mark.parametrize("low_memory", [True, False])
+def test_auto_lag_no_lags_available(low_memory):
+    rnd = np.random.RandomState(12345)
+    y = np.cumsum(rnd.standard_normal(6))
+    adf = ADF(y, trend="c", low_memory=low_memory)
+    assert adf.lags == 0
+    direct = ADF(y, trend="c", lags=0)
+    assert_allclose(adf.stat, direct.stat)
+    assert adf.nobs == direct.nobs
+
+
 @pytest.mark.parametrize("trend", ["n", "c", "ct", "ctt"])
 def test_representations(trend):
     rnd = np.random.RandomState(12345)
@@ -467,6 +597,10 @@ def test_mackinnoncrit_errors():
         mackinnoncrit(regression="ttc")
     with pytest.raises(ValueError):
         mackinnoncrit(dist_type="unknown")
+    with pytest.raises(ValueError, match="Cointegration results"):
+        mackinnoncrit(num_unit_roots=2, dist_type="adf-z")
+    with pytest.raises(ValueError, match="Cointegration results"):
+        mackinnoncrit(num_unit_roots=2, nobs=100, dist_type="dfgls")
     cv_50 = mackinnoncrit(nobs=50)
     cv_inf = mackinnoncrit()
     assert np.all(cv_50 <= cv_inf)
@@ -499,6 +633,29 @@ def test_adf_buggy_timeseries3():
         assert np.isfinite(adf.stat)
 
 
+@pytest.mark.parametrize("nobs, trend", [(5, "c"), (6, "ct")])
+def test_adf_no_residual_df(nobs, trend):
+    rs = np.random.RandomState(0)
+    adf = ADF(rs.standard_normal(nobs), trend=trend, lags=1)
+    with pytest.raises(InfeasibleTestException, match="residual variance cannot"):
+        assert np.isfinite(adf.stat)
+
+
+@pytest.mark.parametrize("test", [ADF, DFGLS])
+def test_constant_series_low_memory(test):
+    x = np.ones(50)
+    res = test(x, trend="c", low_memory=True)
+    with pytest.raises(InfeasibleTestException, match="The maximum lag you are"):
+        assert np.isfinite(res.stat)
+
+
+@pytest.mark.parametrize("trend, y", [("c", np.ones(20)), ("ct", np.arange(20.0))])
+def test_kpss_zero_long_run_variance(trend, y):
+    kpss = KPSS(y, trend=trend, lags=0)
+    with pytest.raises(InfeasibleTestException, match="long-run variance"):
+        assert np.isfinite(kpss.stat)
+
+
 def test_kpss_buggy_timeseries1():
     x = np.asarray([0])
     adf = KPSS(x, lags=0)
@@ -608,6 +765,20 @@ def test_zivot_andrews_error():
         ZivotAndrews(y, trim=0.5)
 
 
+@pytest.mark.filterwarnings("ignore:Mutating unit root:FutureWarning")
+def test_zivot_andrews_cached_all_stats():
+    y = ZIVOT_ANDREWS_DATA["REAL_GNP"].dropna()
+    za = ZivotAndrews(y, lags=2, trend="c")
+    assert np.isfinite(za.stat)
+    za.trend = "t"
+    assert np.isfinite(za.stat)
+    za.trend = "c"
+    assert np.isfinite(za.stat)
+    direct = ZivotAndrews(y, lags=2, trend="c")
+    assert_allclose(za.stat, direct.stat)
+    assert_allclose(za._all_stats, direct._all_stats)
+
+
 def test_zivot_andrews_reduced_rank():
     y = np.random.standard_normal(1000)
     y[1:] = 3.0
@@ -694,6 +865,28 @@ def test_rank_checker(x):
     assert _is_reduced_rank(x)
 
 
+def test_rank_checker_qr():
+    rs = np.random.RandomState(0)
+    x = rs.standard_normal((100, 3))
+    assert not _is_reduced_rank(x, np.linalg.qr(x)[1])[0]
+    x = np.column_stack([x, x[:, 0] + x[:, 1]])
+    reduced, rank = _is_reduced_rank(x, np.linalg.qr(x)[1])
+    assert reduced
+    assert rank == 3
+
+
+def test_rank_checker_qr_column_order():
+    rs = np.random.RandomState(0)
+    t = np.arange(1.0, 501.0)
+    y = 1e7 * t + np.cumsum(rs.standard_normal(500))
+    dy = np.diff(y)
+    x = np.column_stack([y[2:-1], dy[1:-1], dy[:-2], np.ones(497), t[:497]])
+    for cols in ([0, 1, 2, 3, 4], [3, 4, 1, 2, 0]):
+        reduced, rank = _is_reduced_rank(x[:, cols], np.linalg.qr(x[:, cols])[1])
+        assert reduced
+        assert rank == 3
+
+
 @pytest.mark.parametrize("nobs", list(range(1, 11)))
 @pytest.mark.parametrize("trend", ["c", "ct", "t"])
 def test_wrong_exceptions_nearly_constant_series_za_lags(nobs, trend):
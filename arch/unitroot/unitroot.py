@@ -1,5 +1,10 @@
+from arch.compat.numba import jit
+
 from abc import ABCMeta, abstractmethod
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
+from functools import lru_cache
+import math
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 import warnings
 
 from numpy import (
@@ -8,39 +13,46 @@ from numpy import (
     amin,
     any as npany,
     arange,
-    argwhere,
     array,
-    ceil,
+    asarray,
+    ascontiguousarray,
     cumsum,
     diag,
     diff,
     empty,
+    empty_like,
+    eye,
+    flatnonzero,
     float64,
     full,
-    hstack,
     inf,
     int32,
     int64,
     interp,
     isnan,
     log,
+    multiply,
     nan,
-    ones,
     pi,
-    polyval,
     power,
+    sign,
     sort,
     sqrt,
-    squeeze,
+    subtract,
     sum,
+    vander,
+    zeros,
 )
-from numpy.linalg import LinAlgError, inv, matrix_rank, pinv, qr, solve
+from numpy.fft import irfft, rfft
+from numpy.lib.stride_tricks import as_strided
+from numpy.linalg import LinAlgError, inv, matrix_rank, qr
+from numpy.polynomial.polynomial import polyval
 from pandas import DataFrame
-from scipy.stats import norm
+from scipy.linalg import cholesky, get_lapack_funcs, lstsq, solve_triangular
+from scipy.special import ndtr, ndtri
 from statsmodels.iolib.summary import Summary
 from statsmodels.iolib.table import SimpleTable
 from statsmodels.regression.linear_model import OLS, RegressionResults
-from statsmodels.tsa.tsatools import lagmat
 
 from arch.typing import ArrayLike, ArrayLike1D, ArrayLike2D, NDArray
 from arch.unitroot.critical_values.dfgls import (
@@ -67,7 +79,6 @@ from arch.unitroot.critical_values.dickey_fuller import (
 )
 from arch.unitroot.critical_values.kpss import kpss_critical_values
 from arch.unitroot.critical_values.zivot_andrews import za_critical_values
-from arch.utility import cov_nw
 from arch.utility.array import AbstractDocStringInheritor, ensure1d, ensure2d
 from arch.utility.exceptions import (
     InfeasibleTestException,
@@ -115,10 +126,40 @@ SHORT_TREND_DESCRIPTION = {
     "t": "Linear Time Trend (No Const.)",
 }
 
+_LOG_2PI = log(2 * pi)
+
+# Number of test settings whose results are retained by each test instance
+_RESULT_CACHE_SIZE = 8
+
+
+def _copy_container(value: Any) -> Any:
+    """Shallow copy of dict and list values, other values are returned as-is"""
+    if isinstance(value, (dict, list)):
+        return type(value)(value)
+    return value
+
 
-def _is_reduced_rank(x: NDArray) -> Tuple[bool, Optional[int]]:
+def _is_reduced_rank(
+    x: NDArray, r: Optional[NDArray] = None
+) -> Tuple[bool, Optional[int]]:
     """
     Check if a matrix has reduced rank preferring quick checks
+
+    Parameters
+    ----------
+    x : ndarray
+        The matrix to check
+    r : ndarray, optional
+        The upper triangular factor from a QR decomposition of x. If provided,
+        the rank is computed from the SVD of r, which has the same singular
+        values as x, rather than from a SVD of x.
+
+    Returns
+    -------
+    reduced_rank : bool
+        Flag indicating whether x has reduced rank
+    rank : {int, None}
+        The rank of x, if computed
     """
     if x.shape[1] > x.shape[0]:
         return True, None
@@ -126,9 +167,13 @@ def _is_reduced_rank(x: NDArray) -> Tuple[bool, Optional[int]]:
         return True, None
     elif sum(amax(x, axis=0) == amin(x, axis=0)) > 1:
         return True, None
-    else:
+    elif r is None:
         x_rank = matrix_rank(x)
         return x_rank < x.shape[1], x_rank
+    else:
+        # The diagonal of an unpivoted R does not reliably reveal the rank
+        x_rank = matrix_rank(r)
+        return x_rank < x.shape[1], x_rank
 
 
 def _select_best_ic(
@@ -156,18 +201,16 @@ def _select_best_ic(
     lag : int
         The lag length that maximizes the information criterion.
     """
-    llf = -nobs / 2.0 * (log(2 * pi) + log(sigma2) + 1)
-    maxlag = len(sigma2) - 1
-    if method == "aic":
-        crit = -2 * llf + 2 * arange(float(maxlag + 1))
-        icbest, lag = min(zip(crit, arange(maxlag + 1)))
-    elif method == "bic":
-        crit = -2 * llf + log(nobs) * arange(float(maxlag + 1))
-        icbest, lag = min(zip(crit, arange(maxlag + 1)))
+    if method in ("aic", "bic"):
+        llf = -nobs / 2.0 * (_LOG_2PI + log(sigma2) + 1)
+        penalty = 2.0 if method == "aic" else math.log(nobs)
+        crit = -2 * llf + penalty * arange(float(sigma2.shape[0]))
+        lag = int(crit.argmin())
+        icbest = float(crit[lag])
     elif method == "t-stat":
         stop = 1.6448536269514722
-        large_tstat = abs(tstat) >= stop
-        lag = int(squeeze(max(argwhere(large_tstat))))
+        # tstat[0] is inf so that lag 0 is selected when no t-stat is large
+        lag = int(flatnonzero(abs(tstat) >= stop)[-1])
         icbest = float(tstat[lag])
     else:
         raise ValueError("Unknown method")
@@ -184,6 +227,77 @@ maximum lag length to consider smaller models.\
 """
 
 
+def _lag_gram_python(
+    deltay: NDArray, maxlag: int, m: int, xpx: NDArray, xpy: NDArray
+) -> None:
+    """
+    Fills the lagged-difference blocks of the cross-product matrices
+
+    Parameters
+    ----------
+    deltay : ndarray
+        Normalized first difference of the data
+    maxlag : int
+        The highest lag order for lag length selection.
+    m : int
+        Number of leading columns holding the level and deterministic terms
+    xpx : ndarray
+        Cross-product of the regressors. The lower-right maxlag by maxlag
+        block is filled in place.
+    xpy : ndarray
+        Cross-product of the regressors and regressand. The final maxlag
+        elements are filled in place.
+
+    Notes
+    -----
+    Compiled using numba when available to remove the interpreter overhead
+    of the maxlag * (maxlag + 1) / 2 inner products.
+    """
+    nobs = deltay.shape[0] - maxlag
+    lhs = deltay[maxlag:]
+    for i in range(maxlag):
+        x1 = deltay[maxlag - i - 1 : maxlag - i - 1 + nobs]
+        xpy[m + i, 0] = x1 @ lhs
+        for j in range(i, maxlag):
+            x2 = deltay[maxlag - j - 1 : maxlag - j - 1 + nobs]
+            x1px2 = x1 @ x2
+            xpx[m + i, m + j] = x1px2
+            xpx[m + j, m + i] = x1px2
+
+
+def _lag_products_python(x: NDArray, nlags: int, out: NDArray) -> None:
+    """
+    Fills out with the lagged inner products x[i:] @ x[:nobs - i]
+
+    Parameters
+    ----------
+    x : ndarray
+        The array, with nobs elements
+    nlags : int
+        The largest lag
+    out : ndarray
+        nlags + 1 array filled in place
+
+    Notes
+    -----
+    Compiled using numba when available to remove the interpreter overhead
+    of the nlags + 1 inner products.
+    """
+    nobs = x.shape[0]
+    for i in range(nlags + 1):
+        out[i] = x[i:] @ x[: nobs - i]
+
+
+try:
+    import numba  # noqa: F401
+
+    _lag_gram = jit(_lag_gram_python, cache=True)
+    _lag_products_direct = jit(_lag_products_python, cache=True)
+except ImportError:  # pragma: no cover
+    _lag_gram = _lag_gram_python
+    _lag_products_direct = _lag_products_python
+
+
 def _autolag_ols_low_memory(
     y: NDArray, maxlag: int, trend: str, method: str
 ) -> Tuple[float, int]:
@@ -210,69 +324,111 @@ def _autolag_ols_low_memory(
 
     Notes
     -----
-    Minimizes creation of large arrays. Uses approx 6 * nobs temporary values
+    Minimizes creation of large arrays. Uses approx 4 * nobs temporary values
     """
     method = method.lower()
     deltay = diff(y)
-    deltay = deltay / sqrt(deltay @ deltay)
-    lhs = deltay[maxlag:][:, None]
+    deltay_ss = deltay @ deltay
+    if not deltay_ss > 0:
+        # Constant series cannot be normalized and have singular regressors
+        raise InfeasibleTestException(
+            singular_array_error.format(max_lags=maxlag, lag=0)
+        )
+    deltay = deltay / sqrt(deltay_ss)
+    lhs = deltay[maxlag:]
     level = y[maxlag:-1]
     level = level / sqrt(level @ level)
-    trendx = []
     nobs = lhs.shape[0]
-    if trend == "n":
-        trendx = empty((nobs, 0))
-    else:
+    # The normalized deterministic terms are t**p * sqrt(2p + 1) / nobs**(p + 1/2)
+    # for t = 1, ..., nobs. These are never materialized. Cross-products with
+    # the data are scaled weighted sums and cross-products with each other
+    # follow from the closed forms of sum(t**p).
+    powers = []
+    if "tt" in trend:
+        powers.append(2)
+    if "t" in trend:
+        powers.append(1)
+    if trend.startswith("c"):
+        powers.append(0)
+    scales = {p: sqrt(2 * p + 1) / float(nobs) ** (p + 0.5) for p in powers}
+    # Scaled weights t**p * scale so that each cross-product is a single dot
+    weights: Dict[int, NDArray] = {}
+    if "t" in trend:
+        t = arange(1, nobs + 1, dtype=float64)
         if "tt" in trend:
-            tt = arange(1, nobs + 1, dtype=float64)[:, None] ** 2
-            tt *= sqrt(5) / float(nobs) ** (5 / 2)
-            trendx.append(tt)
-        if "t" in trend:
-            t = arange(1, nobs + 1, dtype=float64)[:, None]
-            t *= sqrt(3) / float(nobs) ** (3 / 2)
-            trendx.append(t)
-        if trend.startswith("c"):
-            trendx.append(ones((nobs, 1)) / sqrt(nobs))
-        trendx = hstack(trendx)
-    rhs = hstack([level[:, None], trendx])
-    m = rhs.shape[1]
+            weights[2] = t * t
+            weights[2] *= scales[2]
+        t *= scales[1]
+        weights[1] = t
+
+    def trend_cross(x: NDArray) -> List[float]:
+        return [scales[p] * x.sum() if p == 0 else weights[p] @ x for p in powers]
+
+    n = float(nobs)
+    power_sums = [
+        n,
+        n * (n + 1) / 2,
+        n * (n + 1) * (2 * n + 1) / 6,
+        (n * (n + 1) / 2) ** 2,
+        n * (n + 1) * (2 * n + 1) * (3 * n ** 2 + 3 * n - 1) / 30,
+    ]
+    m = 1 + len(powers)
     xpx = empty((m + maxlag, m + maxlag)) * nan
     xpy = empty((m + maxlag, 1)) * nan
-    xpy[:m] = rhs.T @ lhs
-    xpx[:m, :m] = rhs.T @ rhs
+    xpy[0] = level @ lhs
+    xpy[1:m, 0] = trend_cross(lhs)
+    xpx[0, 0] = level @ level
+    xpx[0, 1:m] = xpx[1:m, 0] = trend_cross(level)
+    for j, p in enumerate(powers):
+        for k, q in enumerate(powers):
+            xpx[1 + j, 1 + k] = scales[p] * scales[q] * power_sums[p + q]
     for i in range(maxlag):
         x1 = deltay[maxlag - i - 1 : -(1 + i)]
-        block = rhs.T @ x1
-        xpx[m + i, :m] = block
-        xpx[:m, m + i] = block
-        xpy[m + i] = x1 @ lhs
-        for j in range(i, maxlag):
-            x2 = deltay[maxlag - j - 1 : -(1 + j)]
-            x1px2 = x1 @ x2
-            xpx[m + i, m + j] = x1px2
-            xpx[m + j, m + i] = x1px2
-    ypy = lhs.T @ lhs
+        xpx[m + i, 0] = xpx[0, m + i] = level @ x1
+        xpx[m + i, 1:m] = xpx[1:m, m + i] = trend_cross(x1)
+    _lag_gram(deltay, maxlag, m, xpx, xpy)
+    ypy = lhs @ lhs
     sigma2 = empty(maxlag + 1)
 
     tstat = empty(maxlag + 1)
     tstat[0] = inf
-    for i in range(m, m + maxlag + 1):
-        xpx_sub = xpx[:i, :i]
-        try:
-            b = solve(xpx_sub, xpy[:i])
-        except LinAlgError:
-            raise InfeasibleTestException(
-                singular_array_error.format(max_lags=maxlag, lag=m - i)
+    # The Cholesky factor of a leading block is the leading block of the factor.
+    # The factorization validates xpx so per-lag solves skip the finite check.
+    try:
+        xpx_chol = cholesky(xpx, lower=True)
+    except LinAlgError:
+        raise InfeasibleTestException(
+            singular_array_error.format(
+                max_lags=maxlag, lag=max(matrix_rank(xpx) - m, 0)
             )
-        sigma2[i - m] = (ypy - b.T @ xpx_sub @ b) / nobs
-        if method == "t-stat":
-            xpxi = inv(xpx_sub)
-            stderr = sqrt(sigma2[i - m] * xpxi[-1, -1])
+        )
+    # Call LAPACK directly to avoid the wrapper overhead in the loop
+    (potrs,) = get_lapack_funcs(("potrs",), (xpx_chol,))
+    for i in range(m, m + maxlag + 1):
+        b, _ = potrs(xpx_chol[:i, :i], xpy[:i], lower=1)
+        # b'X'Xb = b'X'y since X'Xb = X'y
+        sigma2[i - m] = (ypy - b[:, 0] @ xpy[:i, 0]) / nobs
+        if method == "t-stat" and i > m:
+            # The last column of inv(L) is e / L[-1, -1] since L is lower triangular
+            xpxi_mm = 1.0 / xpx_chol[i - 1, i - 1] ** 2
+            stderr = sqrt(sigma2[i - m] * xpxi_mm)
             tstat[i - m] = b[-1] / stderr
 
     return _select_best_ic(method, nobs, sigma2, tstat)
 
 
+class _QRLagSelection(NamedTuple):
+    """Selected lag length and the QR factors of the full lag-selection design"""
+
+    ic_best: float
+    best_lag: int
+    max_lags: int
+    start_lag: int
+    r: NDArray
+    qpy: NDArray
+    ypy: float
+
+
 def _autolag_ols(
     endog: ArrayLike1D, exog: ArrayLike2D, startlag: int, maxlag: int, method: str
 ) -> Tuple[float, int]:
@@ -309,8 +465,22 @@ def _autolag_ols(
     assumed to be in contiguous columns from low to high lag length with
     the highest lag in the last column.
     """
+    selection = _autolag_ols_qr(endog, exog, startlag, maxlag, method)
+    return selection.ic_best, selection.best_lag
+
+
+def _autolag_ols_qr(
+    endog: ArrayLike1D, exog: ArrayLike2D, startlag: int, maxlag: int, method: str
+) -> _QRLagSelection:
+    """
+    Lag length selection that also returns the QR factors of exog
+
+    See _autolag_ols for a description of the parameters.
+    """
     method = method.lower()
-    exog_singular, exog_rank = _is_reduced_rank(exog)
+    maxlag = max(maxlag, 0)
+    q, r = qr(exog)
+    exog_singular, exog_rank = _is_reduced_rank(exog, r)
     if exog_singular:
         if exog_rank is None:
             exog_rank = matrix_rank(exog)
@@ -319,24 +489,155 @@ def _autolag_ols(
                 max_lags=maxlag, lag=max(exog_rank - startlag, 0)
             )
         )
-    q, r = qr(exog)
-    qpy = q.T @ endog
-    ypy = endog.T @ endog
-    xpx = exog.T @ exog
+    qpy = (q.T @ endog).ravel()
+    endog_vec = asarray(endog).ravel()
+    ypy = endog_vec @ endog_vec
+    nobs = float(endog.shape[0])
+    # R b = Q'y so the residual sum of squares of the model with the first i
+    # columns is y'y - ||Q'y[:i]||**2
+    qpy2 = zeros(qpy.shape[0] + 1)
+    cumsum(qpy ** 2, out=qpy2[1:])
+    sigma2 = (ypy - qpy2[startlag : startlag + maxlag + 1]) / nobs
 
-    sigma2 = empty(maxlag + 1)
     tstat = empty(maxlag + 1)
-    nobs = float(endog.shape[0])
     tstat[0] = inf
-    for i in range(startlag, startlag + maxlag + 1):
-        b = solve(r[:i, :i], qpy[:i])
-        sigma2[i - startlag] = (ypy - b.T @ xpx[:i, :i] @ b) / nobs
-        if method == "t-stat" and i > startlag:
-            xpxi = inv(xpx[:i, :i])
-            stderr = sqrt(sigma2[i - startlag] * xpxi[-1, -1])
-            tstat[i - startlag] = b[-1] / stderr
+    if method == "t-stat":
+        # Since R is upper triangular, the last coefficient of the model with
+        # i columns is Q'y[i - 1] / R[i - 1, i - 1] and its variance is
+        # sigma2 / R[i - 1, i - 1] ** 2
+        lags = slice(startlag, startlag + maxlag)
+        tstat[1:] = qpy[lags] * sign(diag(r)[lags]) / sqrt(sigma2[1:])
+
+    ic_best, best_lag = _select_best_ic(method, nobs, sigma2, tstat)
+    return _QRLagSelection(ic_best, best_lag, maxlag, startlag, r, qpy, ypy)
+
+
+def _fill_trend(out: NDArray) -> None:
+    """
+    Fill the columns of out with the deterministic terms 1, t, t**2, ...
+
+    Parameters
+    ----------
+    out : ndarray
+        nobs by ntrend array that is filled in-place. Time runs from 1 to nobs.
+    """
+    ntrend = out.shape[1]
+    if ntrend > 0:
+        out[:, 0] = 1.0
+    if ntrend > 1:
+        out[:, 1] = arange(1.0, out.shape[0] + 1)
+    if ntrend > 2:
+        multiply(out[:, 1], out[:, 1], out=out[:, 2])
 
-    return _select_best_ic(method, nobs, sigma2, tstat)
+
+def _trend_columns(nobs: int, trend: str) -> NDArray:
+    """
+    Deterministic terms for a sample of nobs observations
+
+    Parameters
+    ----------
+    nobs : int
+        The number of observations
+    trend : {'n', 'c', 'ct', 'ctt'}
+        The trend order
+
+    Returns
+    -------
+    ndarray
+        nobs by ntrend array containing 1, t, t**2 for t = 1, ..., nobs.
+        Equivalent to add_trend(nobs=nobs, trend=trend).
+    """
+    ntrend = len(trend) if trend != "n" else 0
+    z = empty((nobs, ntrend), order="F")
+    _fill_trend(z)
+    return z
+
+
+def _sliding_lagmat(x: NDArray, lags: int) -> NDArray:
+    """
+    Read-only view of x and its lags
+
+    Parameters
+    ----------
+    x : ndarray
+        1-d array to lag
+    lags : int
+        The number of lags to include
+
+    Returns
+    -------
+    ndarray
+        A (nobs - lags) by (lags + 1) strided view where column j contains
+        x lagged j times. Equivalent to lagmat(x, lags, trim="both",
+        original="in") without copying.
+    """
+    x = ascontiguousarray(x)
+    stride = x.strides[0]
+    return as_strided(
+        x[lags:],
+        shape=(x.shape[0] - lags, lags + 1),
+        strides=(stride, -stride),
+        writeable=False,
+    )
+
+
+def _lag_products(x: NDArray, nlags: int) -> NDArray:
+    """
+    Compute the lagged inner products of a 1-d array
+
+    Parameters
+    ----------
+    x : ndarray
+        The array, with nobs elements
+    nlags : int
+        The largest lag. Must be smaller than nobs.
+
+    Returns
+    -------
+    ndarray
+        nlags + 1 array where element i is x[i:] @ x[:nobs - i]
+
+    Notes
+    -----
+    Direct inner products cost O(nobs * nlags) while a zero-padded FFT costs
+    O(nobs log nobs) with a much larger constant. The FFT is only used when
+    nlags exceeds 20 * log2(nobs), which is approximately where the two break
+    even. Default lag lengths are always well below this.
+    """
+    nobs = x.shape[0]
+    if nlags <= 20 * math.log2(max(nobs, 2)):
+        out = empty(nlags + 1)
+        _lag_products_direct(ascontiguousarray(x, dtype=float64), nlags, out)
+        return out
+    nfft = 1 << (2 * nobs - 1).bit_length()
+    fx = rfft(x, nfft)
+    fx *= fx.conj()
+    return irfft(fx, nfft)[: nlags + 1]
+
+
+def _bartlett_lrv(u: NDArray, lags: int) -> float:
+    """
+    Newey-West long-run variance of a mean-zero series
+
+    Parameters
+    ----------
+    u : ndarray
+        The series, with nobs elements
+    lags : int
+        The number of lags in the Bartlett kernel. Must be weakly smaller than
+        nobs.
+
+    Returns
+    -------
+    float
+        The long-run variance. Equivalent to cov_nw(u, lags, demean=False).
+    """
+    nobs = u.shape[0]
+    # Lags larger than nobs - 1 have no overlap and contribute zero
+    nlags = min(lags, nobs - 1)
+    u_prod = _lag_products(u, nlags)
+    weights = 1.0 - arange(1.0, nlags + 1) / (lags + 1)
+    return float(u_prod[0] + 2.0 * (weights @ u_prod[1:])) / nobs
 
 
 def _df_select_lags(
@@ -345,7 +646,7 @@ def _df_select_lags(
     max_lags: Optional[int],
     method: str,
     low_memory: bool = False,
-) -> Tuple[float, int]:
+) -> Tuple[float, int, Optional[_QRLagSelection]]:
     """
     Helper method to determine the best lag length in DF-like regressions
 
@@ -368,9 +669,12 @@ def _df_select_lags(
     Returns
     -------
     best_ic : float
-        The information criteria at the selected lag
+        The information criteria at the selected lag. nan if max_lags is 0.
     best_lag : int
         The selected lag
+    selection : {_QRLagSelection, None}
+        The QR factors of the lag-selection design. None if low_memory is True
+        or if max_lags is 0.
 
     Notes
     -----
@@ -383,26 +687,29 @@ def _df_select_lags(
     if trend != "n":
         max_max_lags -= len(trend)
     if max_lags is None:
-        max_lags = int(ceil(12.0 * power(nobs / 100.0, 1 / 4.0)))
+        max_lags = int(math.ceil(12.0 * (nobs / 100.0) ** (1 / 4.0)))
         max_lags = max(min(max_lags, max_max_lags), 0)
     assert max_lags is not None
+    if max_lags <= 0:
+        # Nothing to select, so skip the lag-selection regressions
+        return nan, 0, None
     if low_memory:
-        out = _autolag_ols_low_memory(y, max_lags, trend, method)
-        return out
+        ic_best, best_lag = _autolag_ols_low_memory(y, max_lags, trend, method)
+        return ic_best, best_lag, None
     delta_y = diff(y)
-    rhs = lagmat(delta_y[:, None], max_lags, trim="both", original="in")
-    nobs = rhs.shape[0]
-    rhs[:, 0] = y[-nobs - 1 : -1]  # replace 0 with level of y
-    lhs = delta_y[-nobs:]
+    lagged = _sliding_lagmat(delta_y, max_lags)
+    nobs = lagged.shape[0]
+    ntrend = len(trend) if trend != "n" else 0
+    # Deterministic terms, the level of y and the lagged differences
+    full_rhs = empty((nobs, ntrend + max_lags + 1), order="F")
+    _fill_trend(full_rhs[:, :ntrend])
+    full_rhs[:, ntrend] = y[-nobs - 1 : -1]
+    full_rhs[:, ntrend + 1 :] = lagged[:, 1:]
+    lhs = lagged[:, 0]
 
-    if trend != "n":
-        full_rhs = add_trend(rhs, trend, prepend=True)
-    else:
-        full_rhs = rhs
-
-    start_lag = full_rhs.shape[1] - rhs.shape[1] + 1
-    ic_best, best_lag = _autolag_ols(lhs, full_rhs, start_lag, max_lags, method)
-    return ic_best, best_lag
+    start_lag = ntrend + 1
+    selection = _autolag_ols_qr(lhs, full_rhs, start_lag, max_lags, method)
+    return selection.ic_best, selection.best_lag, selection
 
 
 def _add_column_names(rhs: ArrayLike, lags: int) -> DataFrame:
@@ -435,10 +742,12 @@ def _estimate_df_regression(y: NDArray, trend: str, lags: int) -> RegressionResu
     """
     delta_y = diff(y)
 
-    rhs = lagmat(delta_y[:, None], lags, trim="both", original="in")
-    nobs = rhs.shape[0]
-    lhs = rhs[:, 0].copy()  # lag-0 values are lhs, Is copy() necessary?
-    rhs[:, 0] = y[-nobs - 1 : -1]  # replace lag 0 with level of y
+    lagged = _sliding_lagmat(delta_y, lags)
+    nobs = lagged.shape[0]
+    lhs = lagged[:, 0]
+    rhs = empty((nobs, lags + 1))
+    rhs[:, 0] = y[-nobs - 1 : -1]  # level of y
+    rhs[:, 1:] = lagged[:, 1:]
     rhs = _add_column_names(rhs, lags)
 
     if trend != "n":
@@ -447,9 +756,159 @@ def _estimate_df_regression(y: NDArray, trend: str, lags: int) -> RegressionResu
     return OLS(lhs, rhs).fit()
 
 
+class _DFRegression(NamedTuple):
+    """Coefficients, t-stats and sample size of a (A)DF regression"""
+
+    params: NDArray
+    tvalues: NDArray
+    nobs: int
+
+
+def _df_regression_qr(y: NDArray, trend: str, lags: int) -> _DFRegression:
+    """
+    Estimates the core (A)DF regression using a QR decomposition
+
+    Parameters
+    ----------
+    y : ndarray
+        The data for the lag selection
+    trend : {'nc','c','ct','ctt'}
+        The trend order
+    lags : int
+        The number of lags to include in the ADF regression
+
+    Returns
+    -------
+    res : _DFRegression
+        The parameters, t-stats and number of observations. The columns are
+        ordered as in _estimate_df_regression.
+
+    Raises
+    ------
+    InfeasibleTestException
+        If the regressors have reduced rank or there are no residual degrees
+        of freedom.
+    """
+    delta_y = diff(y)
+    lagged = _sliding_lagmat(delta_y, lags)
+    nobs = lagged.shape[0]
+    lhs = lagged[:, 0]
+    ntrend = len(trend) if trend != "n" else 0
+    rhs = empty((nobs, lags + 1 + ntrend), order="F")
+    rhs[:, 0] = y[-nobs - 1 : -1]  # level of y
+    rhs[:, 1 : lags + 1] = lagged[:, 1:]
+    _fill_trend(rhs[:, lags + 1 :])
+    k = rhs.shape[1]
+    if nobs <= k:
+        raise InfeasibleTestException(
+            f"The (A)DF regression with {lags} lags has {nobs} observations and {k} "
+            "regressors, and so the residual variance cannot be estimated. Use "
+            "fewer lags or a longer series."
+        )
+    q, r = qr(rhs)
+    if _is_reduced_rank(rhs, r)[0]:
+        raise InfeasibleTestException(
+            singular_array_error.format(max_lags=lags, lag=lags)
+        )
+    params = solve_triangular(r, q.T @ lhs, check_finite=False)
+    # Residuals are formed directly since lhs'lhs - qpy'qpy suffers from
+    # cancellation when the fit is nearly perfect
+    resid = rhs @ params
+    subtract(lhs, resid, out=resid)
+    sigma2 = (resid @ resid) / (nobs - k)
+    # diag(inv(R'R)) from the row norms of inv(R)
+    r_inv = solve_triangular(r, eye(k), check_finite=False)
+    stderr = sqrt(sigma2 * sum(r_inv ** 2, axis=1))
+    return _DFRegression(params, params / stderr, nobs)
+
+
+def _df_stat_from_selection(
+    y: NDArray, trend: str, lags: int, selection: _QRLagSelection
+) -> Tuple[float, int]:
+    """
+    Computes the (A)DF t-stat by updating the QR factors used to select lags
+
+    Parameters
+    ----------
+    y : ndarray
+        The data used in the lag selection
+    trend : {'n', 'c', 'ct', 'ctt'}
+        The trend order used in the lag selection
+    lags : int
+        The number of lags to include in the ADF regression. Must not be
+        larger than the maximum lag in the selection.
+    selection : _QRLagSelection
+        The lag selection results including QR factors of the design
+
+    Returns
+    -------
+    stat : float
+        The t-stat of the coefficient on the lagged level
+    nobs : int
+        The number of observations in the ADF regression
+
+    Notes
+    -----
+    The lag-selection sample drops the first max_lags - lags observations of
+    the ADF regression. These rows are stacked beneath the triangular factor,
+    with trend terms continued backward as 1 - (max_lags - lags), ..., 0 so
+    that the parametrization is unchanged, and the result is re-triangularized.
+
+    The residual sum of squares of the lag-selection fit, y'y - qpy'qpy,
+    loses precision to cancellation when the fit is nearly perfect, e.g.,
+    when the differences have a large mean relative to their noise. The
+    regression is directly estimated in this case.
+    """
+    max_lags, start_lag = selection.max_lags, selection.start_lag
+    k = start_lag + lags
+    qpy = selection.qpy[:k]
+    ssr = selection.ypy - qpy @ qpy
+    if ssr < 1e-4 * selection.ypy:
+        res = _df_regression_qr(y, trend, lags)
+        return res.tvalues[0], res.nobs
+    delta_y = diff(y)
+    level_col = start_lag - 1
+    extra = max_lags - lags
+    nobs = delta_y.shape[0] - lags
+    # Augmented system [X y] with the residual norm of the lag-selection fit
+    aug = zeros((k + 1 + extra, k + 1))
+    aug[:k, :k] = selection.r[:k, :k]
+    aug[:k, k] = qpy
+    aug[k, k] = math.sqrt(ssr)
+    if extra:
+        rows = aug[k + 1 :]
+        loc = arange(lags, max_lags)
+        rows[:, :level_col] = vander(
+            arange(1.0 - extra, 1.0), level_col, increasing=True
+        )
+        rows[:, level_col] = y[loc]
+        for j in range(1, lags + 1):
+            rows[:, level_col + j] = delta_y[loc - j]
+        rows[:, k] = delta_y[loc]
+    r_aug = qr(aug, mode="r")
+    r = r_aug[:k, :k]
+    b = solve_triangular(r, r_aug[:k, k])
+    sigma2 = r_aug[k, k] ** 2 / (nobs - k)
+    # inv(R'R)[j, j] = ||inv(R') e_j||**2
+    z = solve_triangular(r, eye(k)[level_col], trans="T")
+    stderr = math.sqrt(sigma2 * z @ z)
+    return b[level_col] / stderr, nobs
+
+
 class UnitRootTest(object, metaclass=ABCMeta):
     """Base class to be used for inheritance in unit root bootstrap"""
 
+    # Attributes set by _compute_statistic that are retained in the result cache
+    _result_fields: Tuple[str, ...] = (
+        "_stat",
+        "_pvalue",
+        "_critical_values",
+        "_nobs",
+        "_lags",
+        "_title",
+        "_summary_text",
+    )
+
     def __init__(
         self, y: ArrayLike, lags: Optional[int], trend: str, valid_trends: Sequence[str]
     ) -> None:
@@ -476,6 +935,7 @@ class UnitRootTest(object, metaclass=ABCMeta):
         self._test_name = ""
         self._title = ""
         self._summary_text: List[str] = []
+        self._cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
 
     def __str__(self) -> str:
         return self.summary().__str__()
@@ -505,13 +965,38 @@ class UnitRootTest(object, metaclass=ABCMeta):
         self._stat = None
         assert self._stat is None
 
+    def _cache_key(self) -> Tuple[Any, ...]:
+        """The settings that determine the test results"""
+        return self._trend, self._lags
+
+    def _cached_results(self) -> Dict[str, Any]:
+        """Copies of the result fields so that callers cannot mutate the cache"""
+        return {
+            field: _copy_container(getattr(self, field))
+            for field in self._result_fields
+        }
+
     def _compute_if_needed(self) -> None:
         """Checks whether the statistic needs to be computed, and computed if
-        needed
+        needed. Results of recent settings are cached so that restoring
+        earlier settings does not require recomputing the test.
         """
         if self._stat is None:
+            key = self._cache_key()
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                for field, value in self._cache[key].items():
+                    setattr(self, field, _copy_container(value))
+                return
             self._check_specification()
             self._compute_statistic()
+            results = self._cached_results()
+            # Also store under the settings with any selected lag length
+            for cache_key in (key, self._cache_key()):
+                self._cache[cache_key] = results
+                self._cache.move_to_end(cache_key)
+            while len(self._cache) > _RESULT_CACHE_SIZE:
+                self._cache.popitem(last=False)
 
     @property
     def null_hypothesis(self) -> str:
@@ -758,8 +1243,8 @@ class ADF(UnitRootTest, metaclass=AbstractDocStringInheritor):
         if low_memory is None:
             self._low_memory = True if self.y.shape[0] > 1e5 else False
 
-    def _select_lag(self) -> None:
-        ic_best, best_lag = _df_select_lags(
+    def _select_lag(self) -> Optional[_QRLagSelection]:
+        ic_best, best_lag, selection = _df_select_lags(
             self._y,
             self._trend,
             self._max_lags,
@@ -768,6 +1253,7 @@ class ADF(UnitRootTest, metaclass=AbstractDocStringInheritor):
         )
         self._ic_best = ic_best
         self._lags = best_lag
+        return selection
 
     def _check_specification(self) -> None:
         trend_order = len(self._trend) if self._trend not in ("n", "nc") else 0
@@ -780,18 +1266,21 @@ class ADF(UnitRootTest, metaclass=AbstractDocStringInheritor):
             )
 
     def _compute_statistic(self) -> None:
+        selection = None
         if self._lags is None:
-            self._select_lag()
+            selection = self._select_lag()
         assert self._lags is not None
         y, trend, lags = self._y, self._trend, self._lags
-        resols = _estimate_df_regression(y, trend, lags)
-        self._regression = resols
-        self._stat = stat = resols.tvalues[0]
-        self._nobs = int(resols.nobs)
+        self._regression = None
+        if selection is not None:
+            stat, nobs = _df_stat_from_selection(y, trend, lags, selection)
+        else:
+            resols = _df_regression_qr(y, trend, lags)
+            stat, nobs = resols.tvalues[0], int(resols.nobs)
+        self._stat = stat
+        self._nobs = nobs
         self._pvalue = mackinnonp(stat, regression=trend, num_unit_roots=1)
-        critical_values = mackinnoncrit(
-            num_unit_roots=1, regression=trend, nobs=resols.nobs
-        )
+        critical_values = mackinnoncrit(num_unit_roots=1, regression=trend, nobs=nobs)
         self._critical_values = {
             "1%": critical_values[0],
             "5%": critical_values[1],
@@ -803,6 +1292,9 @@ class ADF(UnitRootTest, metaclass=AbstractDocStringInheritor):
         """Returns the OLS regression results from the ADF model estimated
         """
         self._compute_if_needed()
+        if self._regression is None:
+            assert self._lags is not None
+            self._regression = _estimate_df_regression(self._y, self._trend, self._lags)
         return self._regression
 
     @property
@@ -819,6 +1311,13 @@ class ADF(UnitRootTest, metaclass=AbstractDocStringInheritor):
             self._lags = None
         self._max_lags = value
 
+    def _reset(self) -> None:
+        super()._reset()
+        self._regression = None
+
+    def _cache_key(self) -> Tuple[Any, ...]:
+        return super()._cache_key() + (self._max_lags,)
+
 
 class DFGLS(UnitRootTest, metaclass=AbstractDocStringInheritor):
     """
@@ -897,6 +1396,7 @@ class DFGLS(UnitRootTest, metaclass=AbstractDocStringInheritor):
         self._max_lags = max_lags
         self._method = method
         self._regression = None
+        self._y_detrended: Optional[NDArray] = None
         self._low_memory = low_memory
         if low_memory is None:
             self._low_memory = True if self.y.shape[0] >= 1e5 else False
@@ -916,28 +1416,43 @@ class DFGLS(UnitRootTest, metaclass=AbstractDocStringInheritor):
                 f"trend {self.trend} and the user-specified number of lags."
             )
 
-    def _compute_statistic(self) -> None:
-        """Core routine to estimate DF-GLS test statistic"""
-        # 1. GLS detrend
+    def _gls_detrend(self) -> NDArray:
+        """GLS detrend the data using the deterministic terms in trend"""
         trend, c = self._trend, self._c
 
         nobs = self._y.shape[0]
         ct = c / nobs
-        z = add_trend(nobs=nobs, trend=trend)
-
-        delta_z = z.copy()
-        delta_z[1:, :] = delta_z[1:, :] - (1 + ct) * delta_z[:-1, :]
-        delta_y = self._y.copy()[:, None]
-        delta_y[1:] = delta_y[1:] - (1 + ct) * delta_y[:-1]
-        detrend_coef = pinv(delta_z) @ delta_y
+        z = _trend_columns(nobs, trend)
         y = self._y
-        y_detrended = y - (z @ detrend_coef).ravel()
+
+        # Quasi-difference out-of-place to avoid overlapping reads and writes
+        delta_z = empty_like(z)
+        delta_z[0] = z[0]
+        multiply(z[:-1], -(1 + ct), out=delta_z[1:])
+        delta_z[1:] += z[1:]
+        delta_y = empty(nobs)
+        delta_y[0] = y[0]
+        multiply(y[:-1], -(1 + ct), out=delta_y[1:])
+        delta_y[1:] += y[1:]
+        detrend_coef = lstsq(delta_z, delta_y, lapack_driver="gelsy")[0]
+        # Residuals are formed in the buffer holding the fitted values
+        y_detrended = z @ detrend_coef
+        subtract(y, y_detrended, out=y_detrended)
+        return y_detrended
+
+    def _compute_statistic(self) -> None:
+        """Core routine to estimate DF-GLS test statistic"""
+        # 1. GLS detrend
+        trend = self._trend
+        y_detrended = self._gls_detrend()
+        self._y_detrended = y_detrended
 
         # 2. determine lag length, if needed
+        selection = None
         if self._lags is None:
             max_lags, method = self._max_lags, self._method
             assert self._low_memory is not None
-            icbest, bestlag = _df_select_lags(
+            icbest, bestlag, selection = _df_select_lags(
                 y_detrended, "n", max_lags, method, low_memory=self._low_memory
             )
             self._lags = bestlag
@@ -945,10 +1460,15 @@ class DFGLS(UnitRootTest, metaclass=AbstractDocStringInheritor):
         # 3. Run Regression
         lags = self._lags
 
-        resols = _estimate_df_regression(y_detrended, lags=lags, trend="n")
-        self._regression = resols
-        self._nobs = int(resols.nobs)
-        self._stat = resols.tvalues[0]
+        self._regression = None
+        if selection is not None:
+            self._stat, self._nobs = _df_stat_from_selection(
+                y_detrended, "n", lags, selection
+            )
+        else:
+            resols = _df_regression_qr(y_detrended, lags=lags, trend="n")
+            self._nobs = int(resols.nobs)
+            self._stat = resols.tvalues[0]
         assert self._stat is not None
         self._pvalue = mackinnonp(self._stat, regression=trend, dist_type="DFGLS")
         critical_values = mackinnoncrit(
@@ -982,6 +1502,14 @@ class DFGLS(UnitRootTest, metaclass=AbstractDocStringInheritor):
         """Returns the OLS regression results from the ADF model estimated
         """
         self._compute_if_needed()
+        if self._regression is None:
+            assert self._lags is not None
+            if self._y_detrended is None:
+                # Not retained when results are restored from the cache
+                self._y_detrended = self._gls_detrend()
+            self._regression = _estimate_df_regression(
+                self._y_detrended, lags=self._lags, trend="n"
+            )
         return self._regression
 
     @property
@@ -998,6 +1526,14 @@ class DFGLS(UnitRootTest, metaclass=AbstractDocStringInheritor):
             self._lags = None
         self._max_lags = value
 
+    def _reset(self) -> None:
+        super()._reset()
+        self._regression = None
+        self._y_detrended = None
+
+    def _cache_key(self) -> Tuple[Any, ...]:
+        return super()._cache_key() + (self._max_lags,)
+
 
 class PhillipsPerron(UnitRootTest, metaclass=AbstractDocStringInheritor):
     """
@@ -1084,6 +1620,12 @@ class PhillipsPerron(UnitRootTest, metaclass=AbstractDocStringInheritor):
            https://ideas.repec.org/p/qed/wpaper/1227.html
     """
 
+    _result_fields = UnitRootTest._result_fields + (
+        "_stat_rho",
+        "_stat_tau",
+        "_stats_key",
+    )
+
     def __init__(
         self,
         y: ArrayLike,
@@ -1096,6 +1638,8 @@ class PhillipsPerron(UnitRootTest, metaclass=AbstractDocStringInheritor):
         self._test_type = test_type
         self._stat_rho = None
         self._stat_tau = None
+        # The (trend, lags) used to compute _stat_rho and _stat_tau
+        self._stats_key: Optional[Tuple[str, int]] = None
         self._test_name = "Phillips-Perron Test"
         self._lags = lags
 
@@ -1109,55 +1653,70 @@ class PhillipsPerron(UnitRootTest, metaclass=AbstractDocStringInheritor):
                 f"trend {self.trend} and the user-specified number of lags."
             )
 
-    def _compute_statistic(self) -> None:
-        """Core routine to estimate PP test statistics"""
+    def _compute_pp_stats(self) -> None:
+        """Estimate the PP regression and both the rho and tau statistics"""
         # 1. Estimate Regression
-        y, trend = self._y, self._trend
-        nobs = y.shape[0]
-
-        if self._lags is None:
-            self._lags = int(ceil(12.0 * power(nobs / 100.0, 1 / 4.0)))
-        lags = self._lags
-
-        rhs = y[:-1, None]
-        rhs = _add_column_names(rhs, 0)
-        lhs = y[1:, None]
-        if trend != "n":
-            rhs = add_trend(rhs, trend)
-
-        resols = OLS(lhs, rhs).fit()
-        k = rhs.shape[1]
-        n, u = resols.nobs, resols.resid
+        y, trend, lags = self._y, self._trend, self._lags
+        assert lags is not None
+        n = y.shape[0] - 1
+        k = 1 + (len(trend) if trend != "n" else 0)
+        rhs = empty((n, k), order="F")
+        rhs[:, 0] = y[:-1]
+        _fill_trend(rhs[:, 1:])
+        lhs = y[1:]
+
+        q, r = qr(rhs)
+        if _is_reduced_rank(rhs, r)[0]:
+            raise InfeasibleTestException(
+                "The regressors in the Phillips-Perron regression are singular. This "
+                "may occur if the series contains constant values."
+            )
+        params = solve_triangular(r, q.T @ lhs, check_finite=False)
+        u = rhs @ params
+        subtract(lhs, u, out=u)
         if u.shape[0] < lags:
             raise InfeasibleTestException(
                 f"The number of observations {u.shape[0]} is less than the number of"
                 f"lags in the long-run covariance estimator, {lags}. You must have "
                 "lags <= nobs."
             )
-        lam2 = cov_nw(u, lags, demean=False)
-        lam = sqrt(lam2)
+        lam2 = _bartlett_lrv(u, lags)
+        lam = math.sqrt(lam2)
         # 2. Compute components
         s2 = u @ u / (n - k)
-        s = sqrt(s2)
+        s = math.sqrt(s2)
         gamma0 = s2 * (n - k) / n
-        sigma = resols.bse[0]
-        sigma2 = sigma ** 2.0
+        # inv(R'R)[0, 0] = ||inv(R') e_0||**2
+        z = solve_triangular(r, eye(k)[0], trans="T", check_finite=False)
+        sigma2 = s2 * (z @ z)
+        sigma = math.sqrt(sigma2)
         if sigma <= 0:
             raise InfeasibleTestException(
                 "The estimated variance of the coefficient in the Phillips-Perron "
                 "regression is 0. This may occur if the series contains constant "
                 "values or the residual variance in the regression is 0."
             )
-        rho = resols.params[0]
+        rho_m1 = params[0] - 1.0
         # 3. Compute statistics
-        self._stat_tau = sqrt(gamma0 / lam2) * ((rho - 1) / sigma) - 0.5 * (
+        self._stat_tau = math.sqrt(gamma0 / lam2) * (rho_m1 / sigma) - 0.5 * (
             (lam2 - gamma0) / lam
         ) * (n * sigma / s)
-        self._stat_rho = n * (rho - 1) - 0.5 * (n ** 2.0 * sigma2 / s2) * (
-            lam2 - gamma0
-        )
+        self._stat_rho = n * rho_m1 - 0.5 * (n * n * sigma2 / s2) * (lam2 - gamma0)
 
-        self._nobs = int(resols.nobs)
+        self._nobs = n
+        self._stats_key = (trend, lags)
+
+    def _compute_statistic(self) -> None:
+        """Core routine to estimate PP test statistics"""
+        trend = self._trend
+        if self._lags is None:
+            nobs = self._y.shape[0]
+            self._lags = int(math.ceil(12.0 * (nobs / 100.0) ** (1 / 4.0)))
+        # Both statistics are computed together, so changing only the test
+        # type does not require re-estimating the regression
+        if self._stats_key != (trend, self._lags):
+            self._compute_pp_stats()
+        n = self._nobs
         if self._test_type == "rho":
             self._stat = self._stat_rho
             dist_type = "ADF-z"
@@ -1189,6 +1748,9 @@ class PhillipsPerron(UnitRootTest, metaclass=AbstractDocStringInheritor):
         self._reset()
         self._test_type = value
 
+    def _cache_key(self) -> Tuple[Any, ...]:
+        return super()._cache_key() + (self._test_type,)
+
 
 class KPSS(UnitRootTest, metaclass=AbstractDocStringInheritor):
     """
@@ -1292,13 +1854,18 @@ class KPSS(UnitRootTest, metaclass=AbstractDocStringInheritor):
     def _compute_statistic(self) -> None:
         # 1. Estimate model with trend
         nobs, y, trend = self._nobs, self._y, self._trend
-        z = add_trend(nobs=nobs, trend=trend)
-        res = OLS(y, z).fit()
+        # The constant and the centered time trend are orthogonal, so the OLS
+        # residuals follow from demeaning and a univariate regression on t
+        u = y - y.mean()
+        if trend == "ct":
+            t = arange(nobs) - (nobs - 1) / 2.0
+            # t @ t = nobs * (nobs ** 2 - 1) / 12
+            u -= ((t @ u) / (nobs * (nobs * nobs - 1) / 12.0)) * t
         # 2. Compute KPSS test
-        self._resids = u = res.resid
+        self._resids = u
         if self._lags is None:
             if self._legacy_lag_selection:
-                self._lags = int(ceil(12.0 * power(nobs / 100.0, 1 / 4.0)))
+                self._lags = int(math.ceil(12.0 * (nobs / 100.0) ** (1 / 4.0)))
             else:
                 self._autolag()
         assert self._lags is not None
@@ -1308,9 +1875,14 @@ class KPSS(UnitRootTest, metaclass=AbstractDocStringInheritor):
                 f"lags in the long-run covariance estimator, {self._lags}. You must have "
                 "lags <= nobs."
             )
-        lam = cov_nw(u, self._lags, demean=False)
+        lam = _bartlett_lrv(u, self._lags)
+        if lam <= 0:
+            raise InfeasibleTestException(
+                "The estimated long-run variance of the residuals is 0. This may "
+                "occur if the series is constant or has an exact linear trend."
+            )
         s = cumsum(u)
-        self._stat = 1 / (nobs ** 2.0) * sum(s ** 2.0) / lam
+        self._stat = (s @ s) / (float(nobs * nobs) * lam)
         self._nobs = u.shape[0]
         assert self._stat is not None
         self._pvalue, critical_values = kpss_crit(self._stat, trend)
@@ -1331,14 +1903,11 @@ class KPSS(UnitRootTest, metaclass=AbstractDocStringInheritor):
         """
         resids = self._resids
         assert resids is not None
-        covlags = int(power(self._nobs, 2.0 / 9.0))
-        s0 = sum(resids ** 2) / self._nobs
-        s1 = 0
-        for i in range(1, covlags + 1):
-            resids_prod = resids[i:] @ resids[: self._nobs - i]
-            resids_prod /= self._nobs / 2
-            s0 += resids_prod
-            s1 += i * resids_prod
+        covlags = int(self._nobs ** (2.0 / 9.0))
+        resids_prod = _lag_products(resids, covlags)
+        resids_prod[1:] /= self._nobs / 2
+        s0 = resids_prod[0] / self._nobs + resids_prod[1:].sum()
+        s1 = arange(1.0, covlags + 1) @ resids_prod[1:]
         if s0 <= 0:
             raise InfeasibleTestException(
                 f"Residuals are all zero and so automatic bandwidth selection cannot "
@@ -1347,8 +1916,8 @@ class KPSS(UnitRootTest, metaclass=AbstractDocStringInheritor):
             )
         s_hat = s1 / s0
         pwr = 1.0 / 3.0
-        gamma_hat = 1.1447 * power(s_hat * s_hat, pwr)
-        autolags = amin([self._nobs, int(gamma_hat * power(self._nobs, pwr))])
+        gamma_hat = 1.1447 * (s_hat * s_hat) ** pwr
+        autolags = min(self._nobs, int(gamma_hat * self._nobs ** pwr))
         self._lags = autolags
 
 
@@ -1414,6 +1983,8 @@ class ZivotAndrews(UnitRootTest, metaclass=AbstractDocStringInheritor):
            Business & Economic Studies, 10: 251-270.
     """
 
+    _result_fields = UnitRootTest._result_fields + ("_all_stats",)
+
     def __init__(
         self,
         y: ArrayLike,
@@ -1494,9 +2065,7 @@ class ZivotAndrews(UnitRootTest, metaclass=AbstractDocStringInheritor):
         exog[:, 0] = c_const
         # lagged y and dy
         exog[:, basecols - 1] = y[baselags : (nobs - 1), 0]
-        exog[:, basecols:] = lagmat(dy, baselags, trim="none")[
-            baselags : exog.shape[0] + baselags
-        ]
+        exog[:, basecols:] = _sliding_lagmat(dy, baselags)[: exog.shape[0], 1:]
         # better time trend: t_const @ t_const = 1 for large nobs
         t_const = arange(1.0, nobs + 2)
         t_const *= sqrt(3) / nobs ** (3 / 2)
@@ -1533,6 +2102,7 @@ class ZivotAndrews(UnitRootTest, metaclass=AbstractDocStringInheritor):
                     )
             stats[bp] = self._quick_ols(dy[baselags:], exog)[basecols - 1]
         # return best seen
+        self._all_stats = full(self._y.shape[0], nan)
         self._all_stats[start_period + 1 : end_period + 1] = stats[
             start_period + 1 : end_period + 1
         ]
@@ -1548,13 +2118,9 @@ class ZivotAndrews(UnitRootTest, metaclass=AbstractDocStringInheritor):
         The p-values are linearly interpolated from the quantiles of the
         simulated ZA test statistic distribution
         """
-        table = za_critical_values[self._trend]
-        y = table[:, 0]
-        x = table[:, 1]
+        x, y, crit_value = _ZA_INTERP[self._trend]
         # ZA cv table contains quantiles multiplied by 100
         self._pvalue = interp(self.stat, x, y) / 100.0
-        cv = [1.0, 5.0, 10.0]
-        crit_value = interp(cv, y, x)
         self._critical_values = {
             "1%": crit_value[0],
             "5%": crit_value[1],
@@ -1613,6 +2179,8 @@ class VarianceRatio(UnitRootTest, metaclass=AbstractDocStringInheritor):
        Press.
     """
 
+    _result_fields = UnitRootTest._result_fields + ("_vr", "_stat_variance")
+
     def __init__(
         self,
         y: ArrayLike,
@@ -1635,7 +2203,7 @@ class VarianceRatio(UnitRootTest, metaclass=AbstractDocStringInheritor):
         self._vr: Optional[float] = None
         self._stat_variance: Optional[float] = None
         quantiles = array([0.01, 0.05, 0.1, 0.9, 0.95, 0.99])
-        for q, cv in zip(quantiles, norm.ppf(quantiles)):
+        for q, cv in zip(quantiles, ndtri(quantiles)):
             self._critical_values[str(int(100 * q)) + "%"] = cv
 
     @property
@@ -1681,6 +2249,9 @@ class VarianceRatio(UnitRootTest, metaclass=AbstractDocStringInheritor):
         self._reset()
         self._debiased = bool(value)
 
+    def _cache_key(self) -> Tuple[Any, ...]:
+        return super()._cache_key() + (self._overlap, self._robust, self._debiased)
+
     def _check_specification(self) -> None:
         assert self._lags is not None
         lags = self._lags
@@ -1708,21 +2279,29 @@ class VarianceRatio(UnitRootTest, metaclass=AbstractDocStringInheritor):
 
         nobs = y.shape[0]
         if trend == "n":
-            mu = 0
+            mu = 0.0
         else:
             mu = (y[-1] - y[0]) / (nobs - 1)
 
-        delta_y = diff(y)
-        nq = delta_y.shape[0]
-        sigma2_1 = sum((delta_y - mu) ** 2.0) / nq
+        # Squared residuals are computed in-place, and reused when robust
+        z2 = subtract(y[1:], y[:-1], dtype=float64)
+        nq = z2.shape[0]
+        z2 -= mu
+        z2 **= 2.0
+        ssr_1 = sum(z2)
+        sigma2_1 = ssr_1 / nq
 
         if not overlap:
-            delta_y_q = y[q::q] - y[0:-q:q]
-            sigma2_q = sum((delta_y_q - q * mu) ** 2.0) / nq
+            resid_q = subtract(y[q::q], y[0:-q:q], dtype=float64)
+            resid_q -= q * mu
+            resid_q **= 2.0
+            sigma2_q = sum(resid_q) / nq
             self._summary_text = ["Computed with non-overlapping blocks"]
         else:
-            delta_y_q = y[q:] - y[:-q]
-            sigma2_q = sum((delta_y_q - q * mu) ** 2.0) / (nq * q)
+            resid_q = subtract(y[q:], y[:-q], dtype=float64)
+            resid_q -= q * mu
+            resid_q **= 2.0
+            sigma2_q = sum(resid_q) / (nq * q)
             self._summary_text = ["Computed with overlapping blocks"]
 
         if debiased and overlap:
@@ -1737,19 +2316,101 @@ class VarianceRatio(UnitRootTest, metaclass=AbstractDocStringInheritor):
             # GH 286, CLM 2.4.39
             self._stat_variance = (2 * (2 * q - 1) * (q - 1)) / (3 * q)
         else:
-            z2 = (delta_y - mu) ** 2.0
-            scale = sum(z2) ** 2.0
-            theta = 0.0
-            for k in range(1, q):
-                delta = nq * z2[k:] @ z2[:-k] / scale
-                # GH 286, CLM 2.4.43
-                theta += 4 * (1 - k / q) ** 2.0 * delta
-            self._stat_variance = theta
+            scale = ssr_1 * ssr_1
+            delta = nq * _lag_products(z2, q - 1)[1:] / scale
+            # GH 286, CLM 2.4.43
+            weights = (1 - arange(1.0, q) / q) ** 2.0
+            self._stat_variance = 4 * weights @ delta
         self._vr = sigma2_q / sigma2_1
         assert self._vr is not None
 
-        self._stat = sqrt(nq) * (self._vr - 1) / sqrt(self._stat_variance)
-        self._pvalue = 2 - 2 * norm.cdf(abs(self._stat))
+        self._stat = math.sqrt(nq) * (self._vr - 1) / math.sqrt(self._stat_variance)
+        self._pvalue = 2 - 2 * ndtr(abs(self._stat))
+
+
+def _coef_tuple(coef: ArrayLike1D) -> Tuple[float, ...]:
+    """Polynomial coefficients as a tuple of Python floats"""
+    return tuple(float(c) for c in coef)
+
+
+def _horner(x: float, coef: Tuple[float, ...]) -> float:
+    """Evaluate a polynomial with ascending coefficients at a scalar"""
+    value = 0.0
+    for c in reversed(coef):
+        value = value * x + c
+    return value
+
+
+def _mackinnonp_params() -> Dict[
+    Tuple[str, str, int],
+    Tuple[float, float, float, Tuple[float, ...], Tuple[float, ...]],
+]:
+    """
+    Collect the p-value parameters keyed by (dist_type, regression, num_unit_roots)
+
+    Values are (maxstat, minstat, starstat, small_p, large_p) where the
+    polynomial coefficients are tuples of floats in ascending order.
+    """
+    params = {}
+    for regression in tau_max:
+        for i in range(len(tau_max[regression])):
+            params[("adf-t", regression, i + 1)] = (
+                tau_max[regression][i],
+                tau_min[regression][i],
+                tau_star[regression][i],
+                _coef_tuple(tau_small_p[regression][i]),
+                _coef_tuple(tau_large_p[regression][i]),
+            )
+    for regression in adf_z_max:
+        params[("adf-z", regression, 1)] = (
+            adf_z_max[regression],
+            adf_z_min[regression],
+            adf_z_star[regression],
+            _coef_tuple(adf_z_small_p[regression]),
+            _coef_tuple(adf_z_large_p[regression]),
+        )
+    for regression in dfgls_tau_max:
+        params[("dfgls", regression, 1)] = (
+            dfgls_tau_max[regression],
+            dfgls_tau_min[regression],
+            dfgls_tau_star[regression],
+            _coef_tuple(dfgls_small_p[regression]),
+            _coef_tuple(dfgls_large_p[regression]),
+        )
+    return params
+
+
+def _mackinnoncrit_params() -> Dict[Tuple[str, str, int], Tuple[NDArray, NDArray]]:
+    """
+    Collect the critical value parameters keyed by
+    (dist_type, regression, num_unit_roots)
+
+    Values are (asymptotic_cv, poly_coef) where poly_coef is ncoef by 3 with
+    coefficients in ascending order.
+    """
+    params = {}
+    for regression, table in tau_2010.items():
+        for i in range(table.shape[0]):
+            params[("adf-t", regression, i + 1)] = (
+                ascontiguousarray(table[i, :, 0]),
+                ascontiguousarray(table[i].T),
+            )
+    for regression in adf_z_cv_approx:
+        table = array(adf_z_cv_approx[regression], dtype=float)
+        params[("adf-z", regression, 1)] = (
+            ascontiguousarray(table[:, 0]),
+            ascontiguousarray(table.T),
+        )
+    for regression, table in dfgls_cv_approx.items():
+        params[("dfgls", regression, 1)] = (
+            ascontiguousarray(table[:, 0]),
+            ascontiguousarray(table.T),
+        )
+    return params
+
+
+_MACKINNONP_PARAMS = _mackinnonp_params()
+_MACKINNONCRIT_PARAMS = _mackinnoncrit_params()
 
 
 def mackinnonp(
@@ -1798,29 +2459,13 @@ def mackinnonp(
     dist_type = dist_type.lower()
     if num_unit_roots > 1 and dist_type.lower() != "adf-t":
         raise ValueError(
-            "Cointegration results (num_unit_roots > 1) are"
+            "Cointegration results (num_unit_roots > 1) are "
             + "only available for ADF-t values"
         )
-    if dist_type == "adf-t":
-        maxstat = tau_max[regression][num_unit_roots - 1]
-        minstat = tau_min[regression][num_unit_roots - 1]
-        starstat = tau_star[regression][num_unit_roots - 1]
-        small_p = tau_small_p[regression][num_unit_roots - 1]
-        large_p = tau_large_p[regression][num_unit_roots - 1]
-    elif dist_type == "adf-z":
-        maxstat = adf_z_max[regression]
-        minstat = adf_z_min[regression]
-        starstat = adf_z_star[regression]
-        small_p = adf_z_small_p[regression]
-        large_p = adf_z_large_p[regression]
-    elif dist_type == "dfgls":
-        maxstat = dfgls_tau_max[regression]
-        minstat = dfgls_tau_min[regression]
-        starstat = dfgls_tau_star[regression]
-        small_p = dfgls_small_p[regression]
-        large_p = dfgls_large_p[regression]
-    else:
+    if dist_type not in ("adf-t", "adf-z", "dfgls"):
         raise ValueError("Unknown test type {0}".format(dist_type))
+    params = _MACKINNONP_PARAMS[(dist_type, regression, num_unit_roots)]
+    maxstat, minstat, starstat, small_p, large_p = params
 
     if stat > maxstat:
         return 1.0
@@ -1829,10 +2474,10 @@ def mackinnonp(
     if stat <= starstat:
         poly_coef = small_p
         if dist_type == "adf-z":
-            stat = log(abs(stat))  # Transform stat for small p ADF-z
+            stat = math.log(abs(stat))  # Transform stat for small p ADF-z
     else:
         poly_coef = large_p
-    return norm.cdf(polyval(poly_coef[::-1], stat))
+    return ndtr(_horner(stat, poly_coef))
 
 
 def mackinnoncrit(
@@ -1893,24 +2538,68 @@ def mackinnoncrit(
         valid_regression = ["c", "ct"]
     if regression not in valid_regression:
         raise ValueError("regression keyword {0} not understood".format(regression))
+    if num_unit_roots > 1 and dist_type != "adf-t":
+        raise ValueError(
+            "Cointegration results (num_unit_roots > 1) are "
+            + "only available for ADF-t values"
+        )
 
-    if dist_type == "adf-t":
-        asymptotic_cv = tau_2010[regression][num_unit_roots - 1, :, 0]
-        poly_coef = tau_2010[regression][num_unit_roots - 1, :, :].T
-    elif dist_type == "adf-z":
-        poly_coef = array(adf_z_cv_approx[regression]).T
-        asymptotic_cv = array(adf_z_cv_approx[regression])[:, 0]
-    elif dist_type == "dfgls":
-        poly_coef = dfgls_cv_approx[regression].T
-        asymptotic_cv = dfgls_cv_approx[regression][:, 0]
-    else:
+    if dist_type not in ("adf-t", "adf-z", "dfgls"):
         raise ValueError("Unknown test type {0}".format(dist_type))
-
     if nobs is inf:
-        return asymptotic_cv
+        asymptotic_cv, _ = _MACKINNONCRIT_PARAMS[
+            (dist_type, regression, num_unit_roots)
+        ]
+        return asymptotic_cv.copy()
     else:
-        # Flip so that highest power to lowest power
-        return polyval(poly_coef[::-1], 1.0 / nobs)
+        return _mackinnoncrit_finite(dist_type, regression, num_unit_roots, nobs).copy()
+
+
+@lru_cache(maxsize=256)
+def _mackinnoncrit_finite(
+    dist_type: str, regression: str, num_unit_roots: int, nobs: float
+) -> NDArray:
+    """Cached finite-sample critical values. The returned array is read-only."""
+    _, poly_coef = _MACKINNONCRIT_PARAMS[(dist_type, regression, num_unit_roots)]
+    crit_vals = polyval(1.0 / nobs, poly_coef)
+    crit_vals.flags.writeable = False
+    return crit_vals
+
+
+def _interp_tables(
+    critical_values: Dict[str, NDArray], descending: bool
+) -> Dict[str, Tuple[NDArray, NDArray, NDArray]]:
+    """
+    Contiguous quantile interpolation tables and the 1%, 5% and 10% critical
+    values, which do not depend on the test statistic
+
+    Parameters
+    ----------
+    critical_values : dict[str, ndarray]
+        Tables keyed by trend with probabilities (times 100) in the first
+        column and statistic quantiles in the second
+    descending : bool
+        Flag indicating that the probabilities are in descending order
+
+    Returns
+    -------
+    dict[str, tuple[ndarray, ndarray, ndarray]]
+        The quantiles, probabilities and critical values for each trend
+    """
+    tables = {}
+    for trend, table in critical_values.items():
+        y = ascontiguousarray(table[:, 0])
+        x = ascontiguousarray(table[:, 1])
+        if descending:
+            crit_value = interp([1.0, 5.0, 10.0], y[::-1], x[::-1])
+        else:
+            crit_value = interp([1.0, 5.0, 10.0], y, x)
+        tables[trend] = (x, y, crit_value)
+    return tables
+
+
+_KPSS_INTERP = _interp_tables(kpss_critical_values, True)
+_ZA_INTERP = _interp_tables(za_critical_values, False)
 
 
 def kpss_crit(stat: float, trend: str = "c") -> Tuple[float, NDArray]:
@@ -1938,15 +2627,11 @@ def kpss_crit(stat: float, trend: str = "c") -> Tuple[float, NDArray]:
     KPSS test statistic distribution using 100,000,000 replications and 2000
     data points.
     """
-    table = kpss_critical_values[trend]
-    y = table[:, 0]
-    x = table[:, 1]
+    x, y, crit_value = _KPSS_INTERP[trend]
     # kpss.py contains quantiles multiplied by 100
     pvalue = interp(stat, x, y) / 100.0
-    cv = [1.0, 5.0, 10.0]
-    crit_value = interp(cv, y[::-1], x[::-1])
 
-    return pvalue, crit_value
+    return pvalue, crit_value.copy()
 
 
 def auto_bandwidth(